@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Deep-zoom tile checker for convert_pdf_to_tiles.
+
+Usage:
+    python check_tiles.py                           # self-test on generated pages
+    python check_tiles.py tiles_folder [--pdf source.pdf]
+
+Checks that every tile listed in manifest.json exists with the size the manifest
+implies (min(tile_size, width - col * tile_size) by the same rule for rows), that
+no stale tiles or levels are left over, and, when the source PDF is given, that
+each tile matches a fresh render of the page region the manifest places it at.
+Tiles are compared one at a time, so the check needs no more memory than the
+render itself. Pixels may differ by up to MAX_PIXEL_DIFF to allow for
+anti-aliasing; a tile placed even one pixel off shows full-contrast differences
+along every edge.
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import tempfile
+from PIL import Image, ImageChops
+import fitz  # PyMuPDF
+
+from image2pdf2image import convert_pdf_to_tiles
+
+MAX_PIXEL_DIFF = 64
+
+
+def _compare_tiles(folder, page, tile_size, zoom, pdf_page, problems):
+    max_level = page["levels"][-1]["level"]
+    origin = pdf_page.rect.tl
+    for level in page["levels"]:
+        scale = zoom / (2 ** (max_level - level["level"]))
+        matrix = fitz.Matrix(scale, scale)
+        for row in range(level["rows"]):
+            for col in range(level["cols"]):
+                rel_path = page["tiles"].format(level=level["level"], col=col, row=row)
+                tile_path = os.path.join(folder, rel_path)
+                if not os.path.exists(tile_path):
+                    continue
+                box = fitz.Rect(col * tile_size, row * tile_size,
+                                min((col + 1) * tile_size, level["width"]),
+                                min((row + 1) * tile_size, level["height"]))
+                clip = box * ~matrix + (origin.x, origin.y, origin.x, origin.y)
+                pix = pdf_page.get_pixmap(matrix=matrix, clip=clip, alpha=False)
+                expected = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                with Image.open(tile_path) as tile:
+                    tile = tile.convert("RGB")
+                    if tile.size != expected.size:
+                        problems.append(f"page {page['page']}: {rel_path} is {tile.size[0]}x{tile.size[1]}, "
+                                        f"its region renders at {expected.size[0]}x{expected.size[1]}")
+                        continue
+                    worst = max(high for _, high in ImageChops.difference(tile, expected).getextrema())
+                if worst > MAX_PIXEL_DIFF:
+                    problems.append(f"page {page['page']}: {rel_path} differs from its page region "
+                                    f"(max pixel difference {worst})")
+
+
+def check_tiles(folder, pdf_path=None):
+    """Return a list of problems found in a tile folder (empty if it is consistent)."""
+    with open(os.path.join(folder, "manifest.json"), encoding='utf-8') as f:
+        manifest = json.load(f)
+    tile_size = manifest["tile_size"]
+    problems = []
+
+    listed_folders = {page["tiles"].split("/")[0] for page in manifest["pages"]}
+    for name in sorted(os.listdir(folder)):
+        if re.fullmatch(r"page_\d+_files", name) and name not in listed_folders:
+            problems.append(f"unexpected page folder '{name}' not listed in the manifest")
+
+    for page in manifest["pages"]:
+        top = page["levels"][-1]
+        if (top["width"], top["height"]) != (page["width"], page["height"]):
+            problems.append(f"page {page['page']}: top level {top['width']}x{top['height']} "
+                            f"!= page {page['width']}x{page['height']}")
+
+        page_folder = os.path.join(folder, page["tiles"].split("/")[0])
+        expected_levels = {str(level["level"]) for level in page["levels"]}
+        for extra in sorted(set(os.listdir(page_folder)) - expected_levels):
+            problems.append(f"page {page['page']}: unexpected level folder '{extra}'")
+
+        for level in page["levels"]:
+            expected = set()
+            for row in range(level["rows"]):
+                for col in range(level["cols"]):
+                    rel_path = page["tiles"].format(level=level["level"], col=col, row=row)
+                    expected.add(os.path.basename(rel_path))
+                    want = (min(tile_size, level["width"] - col * tile_size),
+                            min(tile_size, level["height"] - row * tile_size))
+                    tile_path = os.path.join(folder, rel_path)
+                    if not os.path.exists(tile_path):
+                        problems.append(f"page {page['page']}: missing tile {rel_path}")
+                        continue
+                    with Image.open(tile_path) as tile:
+                        if tile.size != want:
+                            problems.append(f"page {page['page']}: {rel_path} is {tile.size[0]}x{tile.size[1]}, "
+                                            f"expected {want[0]}x{want[1]}")
+            level_folder = os.path.join(page_folder, str(level["level"]))
+            for extra in sorted(set(os.listdir(level_folder)) - expected):
+                problems.append(f"page {page['page']}: unexpected tile {level['level']}/{extra}")
+
+    if pdf_path:
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception as e:
+            problems.append(f"could not open '{pdf_path}': {e}")
+            return problems
+        zoom = manifest["dpi"] / 72
+        for page in manifest["pages"]:
+            try:
+                _compare_tiles(folder, page, tile_size, zoom, doc.load_page(page["page"] - 1), problems)
+            except Exception as e:
+                problems.append(f"page {page['page']}: could not render for comparison: {e}")
+        doc.close()
+
+    return problems
+
+
+def self_test():
+    # US Letter hits the 3300.0000000000005 px rounding case at 300 DPI, and a
+    # 552.96pt square page is exactly 9 tiles wide (2304 px) at the same DPI.
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "sample.pdf")
+        doc = fitz.open()
+        for width, height in [(612, 792), (552.96, 552.96), (842, 595)]:
+            page = doc.new_page(width=width, height=height)
+            page.draw_rect(page.rect + (10, 10, -10, -10), color=(1, 0, 0), width=3)
+            page.draw_line(page.rect.tl, page.rect.br, color=(0, 0, 1), width=2)
+            page.insert_text((72, 72), f"{width} x {height}", fontsize=24)
+        doc.save(pdf_path)
+        doc.close()
+
+        short_pdf_path = os.path.join(tmp, "short.pdf")
+        doc = fitz.open(pdf_path)
+        doc.select([0])
+        doc.save(short_pdf_path)
+        doc.close()
+
+        out = os.path.join(tmp, "tiles")
+        # Render once with different settings so stale tiles would be caught.
+        convert_pdf_to_tiles(pdf_path, out, dpi=150, tile_size=200)
+        convert_pdf_to_tiles(pdf_path, out, dpi=300, tile_size=256)
+        problems = check_tiles(out, pdf_path)
+
+        # Re-render a shorter document into the same folder: pages 2 and 3 must go.
+        convert_pdf_to_tiles(short_pdf_path, out, dpi=300, tile_size=256)
+        return problems + check_tiles(out, short_pdf_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check deep-zoom tiles against their manifest.")
+    parser.add_argument("folder", nargs="?", help="Tile folder containing manifest.json (omit to run the self-test)")
+    parser.add_argument("--pdf", help="Source PDF; also compare each tile with a render of its page region")
+    args = parser.parse_args()
+
+    problems = check_tiles(args.folder, args.pdf) if args.folder else self_test()
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+    print("✅ Tiles match the manifest")
+
+
+if __name__ == "__main__":
+    main()
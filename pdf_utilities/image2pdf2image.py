@@ -1,4 +1,9 @@
 import os
+import glob
+import json
+import math
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.pdfgen import canvas
 from PIL import Image
@@ -45,7 +50,139 @@ def convert_image_to_pdf(image_path, output_pdf_path=None):
     except Exception as e:
         print(f"❌ An error occurred during image to PDF conversion: {e}")
 
-def convert_pdf_to_image(pdf_path, output_folder=None, dpi=300):
+def _render_tile_row(pdf_path, page_num, scale, row, cols, tile_size, level_folder):
+    # Runs in a worker process: PyMuPDF documents can't be shared across workers,
+    # so each task opens its own handle and renders one row of tiles via clip rects.
+    # The page content is interpreted once into a display list and replayed per tile.
+    doc = None
+    try:
+        doc = fitz.open(pdf_path)
+        page = doc.load_page(page_num)
+        page_rect = page.rect
+        display_list = page.get_displaylist()
+        matrix = fitz.Matrix(scale, scale)
+        rendered = 0
+        for col in range(cols):
+            x0 = page_rect.x0 + col * tile_size / scale
+            y0 = page_rect.y0 + row * tile_size / scale
+            clip = fitz.Rect(x0, y0, x0 + tile_size / scale, y0 + tile_size / scale) & page_rect
+            if clip.is_empty:
+                continue
+            pix = display_list.get_pixmap(matrix=matrix, clip=clip)
+            pix.save(os.path.join(level_folder, f"{col}_{row}.png"))
+            rendered += 1
+    except Exception as e:
+        # MuPDF errors wrap SWIG objects that can't be pickled back to the parent process.
+        raise RuntimeError(str(e)) from None
+    finally:
+        if doc is not None:
+            doc.close()
+    return rendered
+
+def _pixel_size(rect, scale):
+    # Use MuPDF's own rounding so the manifest matches the pixmaps it renders.
+    irect = (rect * fitz.Matrix(scale, scale)).irect
+    return irect.width, irect.height
+
+def convert_pdf_to_tiles(pdf_path, output_folder=None, dpi=300, tile_size=256, workers=None):
+    """Render each page into a deep-zoom tile pyramid plus a manifest.json.
+
+    Level 0 fits in a single tile; the top level is the page at `dpi`. Tiles
+    have no overlap. The folder layout resembles DZI but the level numbering
+    does not (DZI's level 0 is 1x1) and no .dzi descriptor is written, so this
+    is a custom pyramid ("scheme": "custom" in the manifest) that clients must
+    read through manifest.json rather than as a standard deep-zoom source. Only
+    one tile is ever rasterized at a time per worker, so memory stays bounded
+    by `tile_size` rather than the page size. A page that fails to render is
+    reported and left out of the manifest; the other pages are kept.
+    """
+    if not os.path.exists(pdf_path):
+        print(f"❌ Error: PDF file not found at '{pdf_path}'")
+        return
+
+    if not output_folder:
+        output_folder = os.path.splitext(pdf_path)[0] + "_tiles"
+    os.makedirs(output_folder, exist_ok=True)
+
+    try:
+        doc = fitz.open(pdf_path)
+        page_rects = [doc.load_page(page_num).rect for page_num in range(len(doc))]
+        doc.close()
+
+        # Clear everything from a previous run (other dpi, tile_size or page count)
+        # up front, so a failure below never leaves a manifest pointing at missing tiles.
+        manifest_path = os.path.join(output_folder, "manifest.json")
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        for stale_folder in glob.glob(os.path.join(output_folder, "page_*_files")):
+            if os.path.isdir(stale_folder):
+                shutil.rmtree(stale_folder)
+
+        manifest = {"scheme": "custom", "source": os.path.basename(pdf_path), "dpi": dpi,
+                    "tile_size": tile_size, "overlap": 0, "format": "png", "pages": []}
+        page_entries = []
+        page_jobs = {}
+        for page_num, rect in enumerate(page_rects):
+            full_zoom = dpi / 72
+            width, height = _pixel_size(rect, full_zoom)
+            max_level = max(0, math.ceil(math.log2(max(width, height, 1) / tile_size)))
+            page_folder = f"page_{page_num + 1}_files"
+
+            levels = []
+            jobs = []
+            for level in range(max_level + 1):
+                scale = full_zoom / (2 ** (max_level - level))
+                level_width, level_height = _pixel_size(rect, scale)
+                cols = math.ceil(level_width / tile_size)
+                rows = math.ceil(level_height / tile_size)
+                levels.append({"level": level, "width": level_width, "height": level_height,
+                               "cols": cols, "rows": rows})
+
+                level_folder = os.path.join(output_folder, page_folder, str(level))
+                os.makedirs(level_folder, exist_ok=True)
+                for row in range(rows):
+                    jobs.append((pdf_path, page_num, scale, row, cols, tile_size, level_folder))
+
+            page_jobs[page_num] = jobs
+            page_entries.append({
+                "page": page_num + 1,
+                "width": width,
+                "height": height,
+                "tiles": f"{page_folder}/{{level}}/{{col}}_{{row}}.png",
+                "levels": levels,
+            })
+
+        tile_count = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            page_futures = {page_num: [executor.submit(_render_tile_row, *job) for job in jobs]
+                            for page_num, jobs in page_jobs.items()}
+            for page_num, entry in enumerate(page_entries):
+                try:
+                    tile_count += sum(future.result() for future in page_futures[page_num])
+                except Exception as e:
+                    print(f"❌ Failed to render page {page_num + 1}: {e}")
+                    # Let the page's other rows finish, then drop whatever they wrote so
+                    # no tiles sit on disk outside the manifest.
+                    for future in page_futures[page_num]:
+                        future.exception()
+                    shutil.rmtree(os.path.join(output_folder, f"page_{page_num + 1}_files"), ignore_errors=True)
+                    continue
+                manifest["pages"].append(entry)
+
+        # Write to a temporary file first so readers never see a half-written manifest.
+        with open(manifest_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(manifest_path + ".tmp", manifest_path)
+        print(f"✅ Rendered {tile_count} tiles for {len(manifest['pages'])} of {len(page_rects)} page(s); "
+              f"manifest saved to '{manifest_path}'")
+
+    except Exception as e:
+        print(f"❌ An error occurred during PDF to tile conversion: {e}")
+
+def convert_pdf_to_image(pdf_path, output_folder=None, dpi=300, tiled=False, tile_size=256, workers=None):
+    if tiled:
+        return convert_pdf_to_tiles(pdf_path, output_folder, dpi=dpi, tile_size=tile_size, workers=workers)
+
     if not os.path.exists(pdf_path):
         print(f"❌ Error: PDF file not found at '{pdf_path}'")
         return
@@ -71,7 +208,7 @@ def convert_pdf_to_image(pdf_path, output_folder=None, dpi=300):
 if __name__ == "__main__":
     print("🖼 File Converter: Image <-> PDF")
     while True:
-        choice = input("\nChoose conversion type:\n1. Image to PDF\n2. PDF to Image\n(Enter 1 or 2): ").strip()
+        choice = input("\nChoose conversion type:\n1. Image to PDF\n2. PDF to Image\n3. PDF to Deep-Zoom Tiles\n(Enter 1, 2 or 3): ").strip()
 
         if choice == '1':
             file_path = input("Enter image file path (e.g., image.jpg): ").strip()
@@ -87,5 +224,12 @@ if __name__ == "__main__":
             else:
                 print("No PDF file path provided.")
             break
+        elif choice == '3':
+            file_path = input("Enter PDF file path (e.g., document.pdf): ").strip()
+            if file_path:
+                convert_pdf_to_image(file_path, tiled=True)
+            else:
+                print("No PDF file path provided.")
+            break
         else:
-            print("Invalid choice. Please enter 1 or 2.")
\ No newline at end of file
+            print("Invalid choice. Please enter 1, 2 or 3.")
\ No newline at end of file